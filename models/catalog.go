@@ -16,6 +16,7 @@ import (
 	"net/url"
 	"os"
 	"regexp"
+	"slices"
 	"sort"
 	"strings"
 	"sync"
@@ -410,12 +411,37 @@ func parse(data []byte) (Catalog, error) {
 	if err := json.Unmarshal(data, &c); err != nil {
 		return nil, fmt.Errorf("catalog parse: %w", err)
 	}
+	internCatalogStrings(c)
 	// Build the reverse modelID → key index so that Get() can resolve
 	// bare model IDs without scanning all entries.
 	BuildIndex(c)
 	return c, nil
 }
 
+// internCatalogStrings makes entries share one copy of each repeated string
+// field. encoding/json allocates a fresh string per occurrence, so otherwise
+// ~2,500 entries each hold their own copy of values with far fewer distinct
+// forms (the bundled catalog has 83 providers and a handful of modes, dates and
+// lifecycle states) for as long as the catalog is loaded.
+func internCatalogStrings(c Catalog) {
+	seen := make(map[string]string)
+	intern := func(s string) string {
+		if v, ok := seen[s]; ok {
+			return v
+		}
+		seen[s] = s
+		return s
+	}
+	for key, m := range c {
+		m.Provider = intern(m.Provider)
+		m.Mode = ModelMode(intern(string(m.Mode)))
+		m.Source = intern(m.Source)
+		m.UpdatedAt = intern(m.UpdatedAt)
+		m.Lifecycle.Status = intern(m.Lifecycle.Status)
+		c[key] = m
+	}
+}
+
 func (c Catalog) lookupUnderPrefix(prefix, modelID string) (Model, bool) {
 	key := prefix + "/" + modelID
 	if m, ok := c[key]; ok {
@@ -454,21 +480,38 @@ func pricingEntryHasInputRate(m Model) bool {
 	return m.Pricing.InputPerMTokens != nil
 }
 
-// catalogPricingFallbackPrefixes returns later prefixes from any alias chain
-// that starts with prefix (e.g. azure_foundry → azure).
-func catalogPricingFallbackPrefixes(prefix string) []string {
-	var out []string
-	for _, chain := range catalogProviderAliases {
+// catalogPricingFallbacks maps each catalog prefix to the later prefixes of
+// every alias chain it appears in (e.g. azure_foundry → azure). The alias
+// table is static, so this is computed once instead of rescanning every chain
+// on each unpriced exact-key hit in resolve.
+var catalogPricingFallbacks = buildCatalogPricingFallbacks()
+
+func buildCatalogPricingFallbacks() map[string][]string {
+	gatewayIDs := make([]string, 0, len(catalogProviderAliases))
+	for id := range catalogProviderAliases {
+		gatewayIDs = append(gatewayIDs, id)
+	}
+	sort.Strings(gatewayIDs)
+
+	out := make(map[string][]string)
+	for _, id := range gatewayIDs {
+		chain := catalogProviderAliases[id]
 		for i, p := range chain {
-			if p == prefix {
-				out = append(out, chain[i+1:]...)
-				break
+			if later := chain[i+1:]; len(later) > 0 {
+				out[p] = append(out[p], later...)
 			}
 		}
 	}
 	return out
 }
 
+// catalogPricingFallbackPrefixes returns later prefixes from any alias chain
+// that starts with prefix (e.g. azure_foundry → azure). The result is shared;
+// callers must not modify it.
+func catalogPricingFallbackPrefixes(prefix string) []string {
+	return catalogPricingFallbacks[prefix]
+}
+
 // getUnderPrefixCaseInsensitive finds a catalog entry whose key is
 // prefix+"/"+modelID, comparing the model segment with strings.EqualFold.
 // Used after an aliased exact-key miss (e.g. azure/phi-4 → azure/Phi-4).
@@ -556,10 +599,16 @@ func (c Catalog) resolve(key string, forPricing bool) (Model, bool) {
 // full chain while every other ID maps to itself. The returned slice is always a
 // fresh copy, so callers may mutate it without corrupting catalogProviderAliases.
 func CatalogPrefixesFor(providerID string) []string {
+	return slices.Clone(catalogPrefixChain(providerID))
+}
+
+// catalogPrefixChain is [CatalogPrefixesFor] without the defensive copy, for
+// read-only callers in this package. The chains hold at most two prefixes, so
+// matching an entry against one with slices.Contains is cheaper than building
+// a set per call and hashing every entry's Provider into it.
+func catalogPrefixChain(providerID string) []string {
 	if chain, ok := catalogProviderAliases[providerID]; ok {
-		out := make([]string, len(chain))
-		copy(out, chain)
-		return out
+		return chain
 	}
 	return []string{providerID}
 }
@@ -570,16 +619,12 @@ func CatalogPrefixesFor(providerID string) []string {
 // included — deprecation is surfaced separately by the /v1/models response.
 // An unknown provider with no entries yields an empty slice.
 func (c Catalog) ModelsForProvider(providerID string) []string {
-	prefixes := CatalogPrefixesFor(providerID)
-	wanted := make(map[string]struct{}, len(prefixes))
-	for _, p := range prefixes {
-		wanted[p] = struct{}{}
-	}
+	prefixes := catalogPrefixChain(providerID)
 
 	seen := make(map[string]struct{})
 	ids := make([]string, 0)
 	for _, m := range c {
-		if _, ok := wanted[m.Provider]; !ok {
+		if !slices.Contains(prefixes, m.Provider) {
 			continue
 		}
 		if _, dup := seen[m.ModelID]; dup {
@@ -599,15 +644,11 @@ func (c Catalog) ModelsForProvider(providerID string) []string {
 // lifecycle states, and works for a provider with no registered credential —
 // the count comes from the catalog alone. An unknown provider yields 0.
 func (c Catalog) ActiveModelCountForProvider(providerID string) int {
-	prefixes := CatalogPrefixesFor(providerID)
-	wanted := make(map[string]struct{}, len(prefixes))
-	for _, p := range prefixes {
-		wanted[p] = struct{}{}
-	}
+	prefixes := catalogPrefixChain(providerID)
 
 	active := make(map[string]struct{})
 	for _, m := range c {
-		if _, ok := wanted[m.Provider]; !ok {
+		if !slices.Contains(prefixes, m.Provider) {
 			continue
 		}
 		if m.IsDeprecated() {
@@ -21,3 +21,14 @@ func BenchmarkGetBareModelID(b *testing.B) {
 		c.Get(bareID)
 	}
 }
+
+// BenchmarkParse benchmarks decoding the embedded catalog, the work done on
+// every load and refresh.
+func BenchmarkParse(b *testing.B) {
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		if _, err := parse(bundledCatalog); err != nil {
+			b.Fatalf("parse: %v", err)
+		}
+	}
+}
@@ -3,6 +3,7 @@ package models
 import (
 	"bytes"
 	"context"
+	"fmt"
 	"net/http"
 	"net/http/httptest"
 	"reflect"
@@ -13,6 +14,7 @@ import (
 	"sync/atomic"
 	"testing"
 	"time"
+	"unsafe"
 
 	"github.com/ferro-labs/ai-gateway/pkg/logger"
 )
@@ -32,6 +34,35 @@ func TestCatalogBackupParseable(t *testing.T) {
 	t.Logf("catalog_backup.json OK — %d entries", len(c))
 }
 
+// TestParseInternsRepeatedStrings verifies parse leaves entries sharing one
+// backing string for repeated fields instead of a decoded copy each. It uses an
+// inline catalog so a weekly backup refresh cannot change what it checks.
+func TestParseInternsRepeatedStrings(t *testing.T) {
+	const entry = `{"provider": "acme", "model_id": %q, "mode": "chat",
+		"lifecycle": {"status": "ga"}, "source": "https://acme.example/pricing",
+		"updated_at": "2026-02-28"}`
+	data := []byte(`{"acme/a": ` + fmt.Sprintf(entry, "a") + `, "acme/b": ` + fmt.Sprintf(entry, "b") + `}`)
+	c, err := parse(data)
+	if err != nil {
+		t.Fatalf("parse: %v", err)
+	}
+	a, b := c["acme/a"], c["acme/b"]
+	for _, f := range []struct {
+		name string
+		a, b string
+	}{
+		{"Provider", a.Provider, b.Provider},
+		{"Mode", string(a.Mode), string(b.Mode)},
+		{"Lifecycle.Status", a.Lifecycle.Status, b.Lifecycle.Status},
+		{"Source", a.Source, b.Source},
+		{"UpdatedAt", a.UpdatedAt, b.UpdatedAt},
+	} {
+		if f.a == "" || unsafe.StringData(f.a) != unsafe.StringData(f.b) { //nolint:gosec // G103: pointer identity is what the interning test asserts
+			t.Errorf("%s strings not shared between entries (%q, %q)", f.name, f.a, f.b)
+		}
+	}
+}
+
 // TestCatalogRequiredFields checks that every entry in the backup has the
 // mandatory fields filled in (provider, model_id, mode). The source field
 // is present in most but not all entries and is logged as informational.
@@ -661,6 +692,31 @@ func TestCatalogPrefixesForDoesNotExposeInternalSlice(t *testing.T) {
 	}
 }
 
+// TestCatalogPricingFallbackPrefixes verifies the precomputed fallback table
+// matches the alias chains: a prefix falls back to the prefixes after it, and
+// the last prefix of a chain (or an unaliased one) has nowhere to go.
+func TestCatalogPricingFallbackPrefixes(t *testing.T) {
+	cases := []struct {
+		prefix string
+		want   []string
+	}{
+		{"azure_openai", []string{"azure"}},
+		{"azure_foundry", []string{"azure"}},
+		{"qwen", []string{"dashscope"}},
+		{"azure", nil},
+		{"vertex_ai", nil},
+		{"openai", nil},
+	}
+	for _, tc := range cases {
+		t.Run(tc.prefix, func(t *testing.T) {
+			got := catalogPricingFallbackPrefixes(tc.prefix)
+			if !reflect.DeepEqual(got, tc.want) {
+				t.Fatalf("catalogPricingFallbackPrefixes(%q) = %v, want %v", tc.prefix, got, tc.want)
+			}
+		})
+	}
+}
+
 // TestModelsForProvider verifies the catalog→provider listing helper against the
 // bundled catalog: correct counts, sorted/deduped output, and identity vs alias
 // resolution.
@@ -4,11 +4,15 @@ set -euo pipefail
 catalog_url="${FERRO_MODEL_CATALOG_URL:-https://github.com/ferro-labs/model-catalog/releases/latest/download/catalog.json}"
 repo_root="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 target="${repo_root}/models/catalog_backup.json"
-tmp="$(mktemp)"
+# Same directory as the target, so the final mv is an atomic rename: the
+# backup is only ever the old file or the complete new one, never partial.
+tmp="$(mktemp "${target}.XXXXXX")"
 trap 'rm -f "${tmp}"' EXIT
 
 curl -fsSL "${catalog_url}" -o "${tmp}"
-python3 -m json.tool "${tmp}" >/dev/null
+# Parse only: json.tool would also re-serialize the whole ~3.4 MB catalog just
+# to throw the output away.
+python3 -c 'import json, sys; json.load(open(sys.argv[1], "rb"))' "${tmp}"
 mv "${tmp}" "${target}"
 
 go test ./models -run TestCatalogBackupParseable -count=1